@@ -1,9 +1,17 @@
+import bisect
 import enum
 import ctypes
-import copy
+import functools
 import os
 import typing
 import platform
+import struct
+import zlib
+
+_U32_LE = struct.Struct('<I')
+_EMPTY_PATH = ctypes.c_wchar_p('')
+_IS_LINUX = 'Linux' in platform.system()
+_IS_WINDOWS = 'Window' in platform.system()
 
 class Verbosity(enum.IntEnum):
     LEVEL_0 = 0
@@ -16,6 +24,27 @@ class DebugPort(enum.IntEnum):
     SWD = 1
 
 class CubeProgrammerError(Exception):
+    # Map status codes to error messages
+    _ERROR_MESSAGES: typing.ClassVar[dict[int, str]] = {
+        -1: "Device not connected",
+        -2: "Device not found",
+        -3: "Device connection error",
+        -4: "No such file",
+        -5: "Operation not supported or unimplemented on this interface",
+        -6: "Interface not supported or unimplemented on this platform",
+        -7: "Insufficient memory",
+        -8: "Wrong parameters",
+        -9: "Memory read failure",
+        -10: "Memory write failure",
+        -11: "Memory erase failure",
+        -12: "File format not supported for this kind of device",
+        -13: "Refresh required",
+        -14: "No security",
+        -15: "Changing frequency problem",
+        -16: "RDP Enabled error",
+        -99: "Other error",
+    }
+
     def __init__(self, status_code):
         self.status_code = status_code
         message = self._get_error_message(status_code)
@@ -24,29 +53,9 @@ class CubeProgrammerError(Exception):
     def __str__(self):
         return f"{super().__str__()} (Status code: {self.status_code})"
 
-    @staticmethod
-    def _get_error_message(status_code):
-        # Map status codes to error messages
-        error_messages = {
-            -1: "Device not connected",
-            -2: "Device not found",
-            -3: "Device connection error",
-            -4: "No such file",
-            -5: "Operation not supported or unimplemented on this interface",
-            -6: "Interface not supported or unimplemented on this platform",
-            -7: "Insufficient memory",
-            -8: "Wrong parameters",
-            -9: "Memory read failure",
-            -10: "Memory write failure",
-            -11: "Memory erase failure",
-            -12: "File format not supported for this kind of device",
-            -13: "Refresh required",
-            -14: "No security",
-            -15: "Changing frequency problem",
-            -16: "RDP Enabled error",
-            -99: "Other error",
-        }
-        return error_messages.get(status_code, "Unknown error occurred.")
+    @classmethod
+    def _get_error_message(cls, status_code):
+        return cls._ERROR_MESSAGES.get(status_code, "Unknown error occurred.")
 
 class CubeProgrammerRegister(enum.IntEnum):
     R0 = 0
@@ -84,10 +93,15 @@ class CubeProgrammerResetMode(enum.IntEnum):
     HARDWARE_RESET = 1
     CORE_RESET = 2
 
+_InitProgressbar = ctypes.CFUNCTYPE(None)
+# The message is a wchar_t*; it is kept as a raw pointer so no str is built for messages that are dropped.
+_LogMessage = ctypes.CFUNCTYPE(None, ctypes.c_int32, ctypes.c_void_p)
+_SetProgressbar = ctypes.CFUNCTYPE(None, ctypes.c_int32, ctypes.c_int32)
+
 class DisplayCallbacks(ctypes.Structure):
-    _fields_ = [("init_progressbar", ctypes.CFUNCTYPE(None)),
-                ("log_message", ctypes.CFUNCTYPE(None, ctypes.c_int32, ctypes.c_wchar_p)),
-                ("set_progressbar", ctypes.CFUNCTYPE(None, ctypes.c_int32, ctypes.c_int32))]
+    _fields_ = [("init_progressbar", _InitProgressbar),
+                ("log_message", _LogMessage),
+                ("set_progressbar", _SetProgressbar)]
     
 class DfuDeviceInfo(ctypes.Structure):
     _fields_ = [
@@ -133,49 +147,87 @@ class TargetInfoParameters(ctypes.Structure):
                 ("revision_id", ctypes.c_char * 8),
                 ("board", ctypes.c_char * 100)]
     
+def _abspath(path:str) -> str:
+    return path if os.path.isabs(path) else os.path.abspath(path)
+
+@functools.lru_cache(maxsize=64)
+def _u32_le_array(count:int) -> struct.Struct:
+    return struct.Struct(f'<{count}I')
+
+def _clone_struct(src:ctypes.Structure) -> ctypes.Structure:
+    dst = type(src)()
+    ctypes.memmove(ctypes.byref(dst), ctypes.byref(src), ctypes.sizeof(src))
+    return dst
+
+def _uint32_list(array:ctypes.Array, count:int) -> list[int]:
+    # ctypes exports '<I' which memoryview.tolist() rejects: go through bytes to get native 'I'.
+    return memoryview(array).cast('B').cast('I')[:count].tolist()
+
 class CubeProgrammerTargetInfo():
+    __slots__ = ('target_info_parameters',
+                 '_device_id',
+                 '_name',
+                 '_revision_id')
+
     def __init__(self, target_info_parameters:TargetInfoParameters) -> None:
-        self.target_info_parameters = copy.deepcopy(target_info_parameters[0])
+        self.target_info_parameters = _clone_struct(target_info_parameters[0])
+        self._device_id = format(self.target_info_parameters.device_id, 'X')
+        self._name = self.target_info_parameters.name.decode('utf-8', errors='replace')
+        self._revision_id = self.target_info_parameters.revision_id.decode('utf-8', errors='replace')
 
     @property
     def device_id(self) -> str:
-        return f'{self.target_info_parameters.device_id:X}'
+        return self._device_id
     
     @property
     def name(self) -> str:
-        return self.target_info_parameters.name.decode('utf-8')
+        return self._name
     
     @property
     def revision_id(self) -> str:
-        return self.target_info_parameters.revision_id.decode('utf-8')
+        return self._revision_id
     
 class CubeProgrammerDfu:
+    __slots__ = ('dfu_device_info',
+                 '_usb_index',
+                 '_bus_number',
+                 '_address_number',
+                 '_product_id',
+                 '_serial_number',
+                 '_dfu_version')
+
     def __init__(self, dfu_device_info: DfuDeviceInfo) -> None:
-        self.dfu_device_info = copy.deepcopy(dfu_device_info)
+        self.dfu_device_info = _clone_struct(dfu_device_info)
+        self._usb_index = self.dfu_device_info.usb_index.decode('utf-8', errors='replace')
+        self._bus_number = self.dfu_device_info.bus_number
+        self._address_number = self.dfu_device_info.address_number
+        self._product_id = self.dfu_device_info.product_id.decode('utf-8', errors='replace')
+        self._serial_number = self.dfu_device_info.serial_number.decode('utf-8', errors='replace')
+        self._dfu_version = self.dfu_device_info.dfu_version
 
     @property
     def usb_index(self) -> str:
-        return self.dfu_device_info.usb_index.decode('utf-8')
+        return self._usb_index
     
     @property
     def bus_number(self) -> int:
-        return self.dfu_device_info.bus_number
+        return self._bus_number
     
     @property
     def address_number(self) -> int:
-        return self.dfu_device_info.address_number
+        return self._address_number
     
     @property
     def product_id(self) -> str:
-        return self.dfu_device_info.product_id.decode('utf-8')
+        return self._product_id
     
     @property
     def serial_number(self) -> str:
-        return self.dfu_device_info.serial_number.decode('utf-8')
+        return self._serial_number
     
     @property
     def dfu_version(self) -> int:
-        return self.dfu_device_info.dfu_version
+        return self._dfu_version
     
     def __str__(self) -> str:
         return f'USB Index: {self.usb_index}\n'\
@@ -186,85 +238,114 @@ class CubeProgrammerDfu:
                f'DFU Version: {self.dfu_version}\n'
 
 class CubeProgrammerSTLink():
+    __slots__ = ('debug_connect_parameters',
+                 '_firmware_version',
+                 '_serial_number',
+                 '_board',
+                 '_target_voltage',
+                 '_index',
+                 '_access_port_count',
+                 '_debug_port',
+                 '_speed',
+                 '_old_firmware',
+                 '_bridge',
+                 '_shared',
+                 '_debug_sleep',
+                 '_jtag_frequencies',
+                 '_swd_frequencies')
 
     def __init__(self, debug_connect_parameters:DebugConnectParameters) -> None:
-        self.debug_connect_parameters = copy.deepcopy(debug_connect_parameters)
+        self.debug_connect_parameters = _clone_struct(debug_connect_parameters)
+        self._firmware_version = self.debug_connect_parameters.firmware_version.decode('utf-8', errors='replace')
+        self._serial_number = self.debug_connect_parameters.serial_number.decode('utf-8', errors='replace')
+        self._board = self.debug_connect_parameters.board.decode('utf-8', errors='replace')
+        try:
+            self._target_voltage = float(self.debug_connect_parameters.target_voltage.decode('utf-8', errors='replace'))
+        except ValueError:
+            self._target_voltage = float('nan')
+        self._index = self.debug_connect_parameters.index
+        self._access_port_count = self.debug_connect_parameters.access_port_count
+        self._debug_port = self.debug_connect_parameters.debug_port
+        self._speed = self.debug_connect_parameters.speed
+        self._old_firmware = self.debug_connect_parameters.old_firmware == 1
+        self._bridge = self.debug_connect_parameters.bridge == 1
+        self._shared = self.debug_connect_parameters.shared == 1
+        self._debug_sleep = self.debug_connect_parameters.debug_sleep == 1
+        self._jtag_frequencies = _uint32_list(self.debug_connect_parameters.jtag_freq, self.debug_connect_parameters.jtag_freq_count)
+        self._swd_frequencies = _uint32_list(self.debug_connect_parameters.swd_freq, self.debug_connect_parameters.swd_freq_count)
 
     @property
     def firmware_version(self) -> str:
-        return self.debug_connect_parameters.firmware_version.decode('utf-8')
+        return self._firmware_version
     
     @property
     def serial_number(self) -> str:
-        return self.debug_connect_parameters.serial_number.decode('utf-8')
+        return self._serial_number
     
     @property
     def board(self) -> str:
-        return self.debug_connect_parameters.board.decode('utf-8')
+        return self._board
     
     @property
     def target_voltage(self) -> float:
-        return float(self.debug_connect_parameters.target_voltage.decode('utf-8'))
-        
-    @property
-    def connection_mode(self) -> CubeProgrammerConnectionMode:
-        return self.debug_connect_parameters.connection_mode
-    
-    @property
-    def reset_mode(self) -> CubeProgrammerResetMode:
-        return self.debug_connect_parameters.reset_mode
-    
-    @property
-    def access_port(self) -> int:
-        return self.debug_connect_parameters.access_port
+        return self._target_voltage
     
     @property
     def index(self) -> int:
-        return self.debug_connect_parameters.index
-    
-    @property
-    def index(self) -> int:
-        return self.debug_connect_parameters.index
+        return self._index
     
     @property
     def access_port_count(self) -> int:
-        return self.debug_connect_parameters.access_port_count
+        return self._access_port_count
     
     @property
     def debug_port(self) -> int:
-        return self.debug_connect_parameters.debug_port
-    
-    @property
-    def frequency(self) -> int:
-        return self.debug_connect_parameters.frequency
+        return self._debug_port
     
     @property
     def speed(self) -> int:
-        return self.debug_connect_parameters.speed
+        return self._speed
         
     @property
     def old_firmware(self) -> bool:
-        return self.debug_connect_parameters.old_firmware == 1
+        return self._old_firmware
     
     @property
     def bridge(self) -> bool:
-        return self.debug_connect_parameters.bridge == 1
+        return self._bridge
     
     @property
     def shared(self) -> bool:
-        return self.debug_connect_parameters.shared == 1
+        return self._shared
     
     @property
     def debug_sleep(self) -> bool:
-        return self.debug_connect_parameters.debug_sleep == 1
+        return self._debug_sleep
     
     @property
     def jtag_frequencies(self) -> list[int]:
-        return list(self.debug_connect_parameters.jtag_freq[:self.debug_connect_parameters.jtag_freq_count])
+        return list(self._jtag_frequencies)
 
     @property
     def swd_frequencies(self) -> list[int]:
-        return list(self.debug_connect_parameters.swd_freq[:self.debug_connect_parameters.swd_freq_count])
+        return list(self._swd_frequencies)
+
+    # The settings below are passed to connectStLink, so they write through to the structure.
+    @property
+    def connection_mode(self) -> CubeProgrammerConnectionMode:
+        return self.debug_connect_parameters.connection_mode
+    
+    @property
+    def reset_mode(self) -> CubeProgrammerResetMode:
+        return self.debug_connect_parameters.reset_mode
+    
+    @property
+    def access_port(self) -> int:
+        return self.debug_connect_parameters.access_port
+    
+    @property
+    def frequency(self) -> int:
+        return self.debug_connect_parameters.frequency
     
     @access_port.setter
     def access_port(self, value:int):
@@ -307,37 +388,94 @@ class CubeProgrammerApi():
     display_callbacks: DisplayCallbacks
     
     def __init__(self, path:str) -> None:
-        if 'Linux' in platform.system():
+        if _IS_LINUX:
             dll_path = os.path.abspath(rf'{path}/api/lib/libCubeProgrammer_API.so')
             flashloader_path = os.path.abspath(rf'{path}/bin')
-        elif 'Window' in platform.system():
+        elif _IS_WINDOWS:
             dll_path = os.path.abspath(rf'{path}/api/lib/CubeProgrammer_API.dll')
             flashloader_path = os.path.abspath(rf'{path}/bin')
         else:
             raise NotImplementedError("Platform not supported yet.")
         
+        # Functions loaded through ctypes.cdll release the GIL for the duration of each call,
+        # so long operations such as downloadFile or massErase do not stall other threads.
         self.dll = ctypes.cdll.LoadLibrary(dll_path)
-        self.display_callbacks = DisplayCallbacks(
-            ctypes.CFUNCTYPE(None)(CubeProgrammerApi._init_progressbar),
-            ctypes.CFUNCTYPE(None, ctypes.c_int32, ctypes.c_wchar_p)(CubeProgrammerApi._log_message),
-            ctypes.CFUNCTYPE(None, ctypes.c_int32, ctypes.c_int32)(CubeProgrammerApi._set_progessbar)
-        )
-        self.dll.setLoadersPath(flashloader_path.encode('utf-8'))
-        self.dll.setDisplayCallbacks(self.display_callbacks)
-        self.dll.setVerbosityLevel(Verbosity.LEVEL_0)
 
+        self.dll.setLoadersPath.argtypes = [ctypes.c_char_p]
+        self.dll.setLoadersPath.restype = None
+        self.dll.setDisplayCallbacks.argtypes = [DisplayCallbacks]
+        self.dll.setDisplayCallbacks.restype = None
+        self.dll.setVerbosityLevel.argtypes = [ctypes.c_int32]
+        self.dll.setVerbosityLevel.restype = None
+
+        self.dll.getStLinkEnumerationList.argtypes = [ctypes.POINTER(ctypes.POINTER(DebugConnectParameters)), ctypes.c_int32]
         self.dll.getStLinkEnumerationList.restype = ctypes.c_int32
+        self.dll.getStLinkList.argtypes = [ctypes.POINTER(ctypes.POINTER(DebugConnectParameters)), ctypes.c_int32]
         self.dll.getStLinkList.restype = ctypes.c_int32
+        # The SDK takes debugConnectParameters by value: passing a pointer here would break the ABI.
+        self.dll.connectStLink.argtypes = [DebugConnectParameters]
         self.dll.connectStLink.restype = ctypes.c_int32
+        self.dll.getDfuDeviceList.argtypes = [ctypes.POINTER(ctypes.POINTER(DfuDeviceInfo)), ctypes.c_int32, ctypes.c_int32]
+        self.dll.getDfuDeviceList.restype = ctypes.c_int32
+        self.dll.connectDfuBootloader.argtypes = [ctypes.c_char_p]
+        self.dll.connectDfuBootloader.restype = ctypes.c_int32
+        self.dll.deleteInterfaceList.argtypes = []
+        self.dll.deleteInterfaceList.restype = None
+        self.dll.disconnect.argtypes = []
+        self.dll.disconnect.restype = None
+        self.dll.checkDeviceConnection.argtypes = []
+        self.dll.checkDeviceConnection.restype = ctypes.c_int32
+
+        self.dll.downloadFile.argtypes = [ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_wchar_p]
         self.dll.downloadFile.restype = ctypes.c_int32
+        self.dll.getDeviceGeneralInf.argtypes = []
         self.dll.getDeviceGeneralInf.restype = ctypes.POINTER(TargetInfoParameters)
+        self.dll.massErase.argtypes = [ctypes.c_char_p]
         self.dll.massErase.restype = ctypes.c_int32
+        self.dll.readMemory.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)), ctypes.c_uint32]
         self.dll.readMemory.restype = ctypes.c_int32
+        self.dll.freeLibraryMemory.argtypes = [ctypes.c_void_p]
+        self.dll.freeLibraryMemory.restype = None
+        self.dll.writeMemory.argtypes = [ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32]
         self.dll.writeMemory.restype = ctypes.c_int32
+        self.dll.readCortexReg.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32)]
         self.dll.readCortexReg.restype = ctypes.c_int32
+        self.dll.writeCortexRegistres.argtypes = [ctypes.c_uint32, ctypes.c_uint32]
         self.dll.writeCortexRegistres.restype = ctypes.c_int32
+        self.dll.sendOptionBytesCmd.argtypes = [ctypes.c_char_p]
+        self.dll.sendOptionBytesCmd.restype = ctypes.c_int32
+        self.dll.reset.argtypes = [ctypes.c_int32]
         self.dll.reset.restype = ctypes.c_int32
 
+        self.dll.startFus.argtypes = []
+        self.dll.startFus.restype = ctypes.c_int32
+        self.dll.firmwareDelete.argtypes = []
+        self.dll.firmwareDelete.restype = ctypes.c_int32
+        self.dll.firmwareUpgrade.argtypes = [ctypes.c_wchar_p, ctypes.c_uint32, ctypes.c_int32, ctypes.c_int32, ctypes.c_int32]
+        self.dll.firmwareUpgrade.restype = ctypes.c_int32
+        self.dll.startWirelessStack.argtypes = []
+        self.dll.startWirelessStack.restype = ctypes.c_int32
+        self.dll.updateAuthKey.argtypes = [ctypes.c_wchar_p]
+        self.dll.updateAuthKey.restype = ctypes.c_int32
+        self.dll.authKeyLock.argtypes = []
+        self.dll.authKeyLock.restype = ctypes.c_int32
+        self.dll.writeUserKey.argtypes = [ctypes.c_wchar_p, ctypes.c_ubyte]
+        self.dll.writeUserKey.restype = ctypes.c_int32
+        self.dll.antiRollBack.argtypes = []
+        self.dll.antiRollBack.restype = ctypes.c_int32
+
+        self.display_callbacks = DisplayCallbacks(
+            _InitProgressbar(CubeProgrammerApi._init_progressbar),
+            _LogMessage(CubeProgrammerApi._log_message),
+            _SetProgressbar(CubeProgrammerApi._set_progessbar)
+        )
+        self.dll.setLoadersPath(flashloader_path.encode('utf-8'))
+        self.dll.setDisplayCallbacks(self.display_callbacks)
+        self.dll.setVerbosityLevel(Verbosity.LEVEL_0)
+
+        # Shared by read_register: like the DLL itself, not safe to use from several threads.
+        self._reg_scratch = ctypes.c_uint32()
+
         self.stlink = CubeProgrammerApi.STLink(self.dll)
         self.dfu = CubeProgrammerApi.Dfu(self.dll)
 
@@ -349,14 +487,24 @@ class CubeProgrammerApi():
         def probe(self) -> list[CubeProgrammerSTLink]:
             debug_connect_parameters = ctypes.POINTER(DebugConnectParameters)()
             stlink_count = self.dll.getStLinkEnumerationList(ctypes.byref(debug_connect_parameters), 0)
-            stlinks = [CubeProgrammerSTLink(debug_connect_parameters[i]) for i in range(stlink_count)]
-            return stlinks
+            try:
+                if stlink_count <= 0:
+                    return []
+                debug_connect_parameters = ctypes.cast(debug_connect_parameters, ctypes.POINTER(DebugConnectParameters * stlink_count)).contents
+                return [CubeProgrammerSTLink(parameters) for parameters in debug_connect_parameters]
+            finally:
+                self.dll.deleteInterfaceList()
         
         def find(self) -> list[CubeProgrammerSTLink]:
             debug_connect_parameters = ctypes.POINTER(DebugConnectParameters)()
             stlink_count = self.dll.getStLinkList(ctypes.byref(debug_connect_parameters), 0)
-            stlinks = [CubeProgrammerSTLink(debug_connect_parameters[i]) for i in range(stlink_count)]
-            return stlinks
+            try:
+                if stlink_count <= 0:
+                    return []
+                debug_connect_parameters = ctypes.cast(debug_connect_parameters, ctypes.POINTER(DebugConnectParameters * stlink_count)).contents
+                return [CubeProgrammerSTLink(parameters) for parameters in debug_connect_parameters]
+            finally:
+                self.dll.deleteInterfaceList()
         
         def connect(self, stlink:CubeProgrammerSTLink) -> None:
             status = self.dll.connectStLink(stlink.debug_connect_parameters)
@@ -370,8 +518,13 @@ class CubeProgrammerApi():
         def probe(self) -> list[CubeProgrammerDfu]:
             dfu_device_infos = ctypes.POINTER(DfuDeviceInfo)()
             dfu_count = self.dll.getDfuDeviceList(ctypes.byref(dfu_device_infos), 0xdf11, 0x0483)
-            dfus = [CubeProgrammerDfu(dfu_device_infos[i]) for i in range(dfu_count)]
-            return dfus
+            try:
+                if dfu_count <= 0:
+                    return []
+                dfu_device_infos = ctypes.cast(dfu_device_infos, ctypes.POINTER(DfuDeviceInfo * dfu_count)).contents
+                return [CubeProgrammerDfu(dfu_device_info) for dfu_device_info in dfu_device_infos]
+            finally:
+                self.dll.deleteInterfaceList()
         
         def connect(self, dfu:CubeProgrammerDfu) -> None:
             status = self.dll.connectDfuBootloader(dfu.dfu_device_info.usb_index)
@@ -383,11 +536,11 @@ class CubeProgrammerApi():
                  address:int,
                  skip_erase:bool,
                  verify:bool) -> None:
-        status = self.dll.downloadFile(os.path.abspath(path),
+        status = self.dll.downloadFile(_abspath(path),
                                      address,
                                      int(skip_erase),
                                      int(verify),
-                                     "")
+                                     _EMPTY_PATH)
         if status != 0:
             raise CubeProgrammerError(status)
 
@@ -396,7 +549,7 @@ class CubeProgrammerApi():
         return CubeProgrammerTargetInfo(target_info_parameters)
     
     def mass_erase(self) -> None:
-        status = self.dll.massErase()
+        status = self.dll.massErase(None)
         if status != 0:
             raise CubeProgrammerError(status)
     
@@ -405,19 +558,68 @@ class CubeProgrammerApi():
         status = self.dll.readMemory(address, ctypes.byref(buffer), size)
         if status != 0:
             raise CubeProgrammerError(status)
-        return bytes(buffer[:size])
+        data = ctypes.string_at(buffer, size)
+        self.dll.freeLibraryMemory(buffer)
+        return data
     
     def write_memory(self, address:int, data: bytes) -> None:
         status = self.dll.writeMemory(address, data, len(data))
         if status != 0:
             raise CubeProgrammerError(status)
+
+    def read_memory_ranges(self, ranges:list[tuple[int, int]]) -> list[bytes]:
+        ranges = list(ranges)
+        for address, size in ranges:
+            if size < 0:
+                raise ValueError(f"Negative read size {size} at address 0x{address:08X}")
+        merged = []
+        for address, size in sorted(r for r in ranges if r[1] > 0):
+            if merged and address <= merged[-1][0] + merged[-1][1]:
+                start, length = merged[-1]
+                merged[-1] = (start, max(length, address + size - start))
+            else:
+                merged.append((address, size))
+        blocks = [(start, self.read_memory(start, length)) for start, length in merged]
+        data = []
+        for address, size in ranges:
+            if size == 0:
+                data.append(b'')
+                continue
+            start, block = blocks[bisect.bisect_right(blocks, address, key=lambda b: b[0]) - 1]
+            offset = address - start
+            data.append(block[offset:offset + size])
+        return data
+
+    def write_memory_ranges(self, chunks:list[tuple[int, bytes]]) -> None:
+        merged = []
+        for address, data in sorted((c for c in chunks if len(c[1]) > 0), key=lambda chunk: chunk[0]):
+            if merged and address < merged[-1][0] + len(merged[-1][1]):
+                raise ValueError(f"Overlapping memory chunks at address 0x{address:08X}")
+            if merged and address == merged[-1][0] + len(merged[-1][1]):
+                merged[-1][1].extend(data)
+            else:
+                merged.append((address, bytearray(data)))
+        for address, data in merged:
+            self.write_memory(address, bytes(data))
+
+    def verify_memory(self, address:int, data:bytes) -> bool:
+        return self.read_memory(address, len(data)) == data
+
+    def crc32_memory(self, address:int, size:int) -> int:
+        return zlib.crc32(self.read_memory(address, size))
+
+    def read_memory32(self, address:int, count:int) -> list[int]:
+        data = self.read_memory(address, count * _U32_LE.size)
+        return list(_u32_le_array(count).unpack(data))
+
+    def write_memory32(self, address:int, words:list[int]) -> None:
+        self.write_memory(address, _u32_le_array(len(words)).pack(*words))
         
     def read_register(self, register: CubeProgrammerRegister) -> int:
-        data = ctypes.c_uint32()
-        status = self.dll.readCortexReg(register, ctypes.byref(data))
+        status = self.dll.readCortexReg(register, ctypes.byref(self._reg_scratch))
         if status != 0:
             raise CubeProgrammerError(status)
-        return data.value
+        return self._reg_scratch.value
 
     def write_register(self, register: CubeProgrammerRegister, data: int) -> None:
         status = self.dll.writeCortexRegistres(register, data)
@@ -455,7 +657,7 @@ class CubeProgrammerApi():
                          address: int, 
                          first_install: bool, 
                          verify: bool) -> None:
-        status = self.dll.firmwareUpgrade(os.path.abspath(path),
+        status = self.dll.firmwareUpgrade(_abspath(path),
                                      address,
                                      int(first_install),
                                      int(0),
@@ -469,7 +671,7 @@ class CubeProgrammerApi():
             raise CubeProgrammerError(status)
         
     def update_authentication_key(self, path:str) -> None:
-        status = self.dll.updateAuthKey(os.path.abspath(path))
+        status = self.dll.updateAuthKey(_abspath(path))
         if not status:
             raise CubeProgrammerError(status)
 
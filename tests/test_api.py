@@ -0,0 +1,60 @@
+import unittest
+
+from stm32cubeprog import CubeProgrammerApi
+
+
+class FakeCubeProgrammerApi(CubeProgrammerApi):
+    def __init__(self) -> None:
+        self.memory = bytearray(range(256))
+        self.reads = []
+        self.writes = []
+
+    def read_memory(self, address:int, size:int) -> bytes:
+        self.reads.append((address, size))
+        return bytes(self.memory[address:address + size])
+
+    def write_memory(self, address:int, data:bytes) -> None:
+        self.writes.append((address, bytes(data)))
+        self.memory[address:address + len(data)] = data
+
+
+class TestReadMemoryRanges(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api = FakeCubeProgrammerApi()
+
+    def test_merges_touching_overlapping_and_unordered_ranges(self):
+        ranges = [(8, 4), (0, 4), (4, 4), (2, 4), (100, 2)]
+        data = self.api.read_memory_ranges(ranges)
+        self.assertEqual(data, [bytes(self.api.memory[a:a + s]) for a, s in ranges])
+        self.assertEqual(self.api.reads, [(0, 12), (100, 2)])
+
+    def test_accepts_a_generator(self):
+        data = self.api.read_memory_ranges((a, 4) for a in (0, 4))
+        self.assertEqual(data, [bytes(range(0, 4)), bytes(range(4, 8))])
+
+    def test_zero_size_range_is_not_read(self):
+        self.assertEqual(self.api.read_memory_ranges([(200, 0)]), [b''])
+        self.assertEqual(self.api.reads, [])
+
+    def test_negative_size_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.api.read_memory_ranges([(0, 4), (8, -1)])
+        self.assertEqual(self.api.reads, [])
+
+
+class TestWriteMemoryRanges(unittest.TestCase):
+    def setUp(self) -> None:
+        self.api = FakeCubeProgrammerApi()
+
+    def test_merges_touching_chunks(self):
+        self.api.write_memory_ranges([(4, b'bbbb'), (0, b'aaaa'), (50, b'c')])
+        self.assertEqual(self.api.writes, [(0, b'aaaabbbb'), (50, b'c')])
+
+    def test_overlapping_chunks_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.api.write_memory_ranges([(2, b'xx'), (0, b'yyyy')])
+        self.assertEqual(self.api.writes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()